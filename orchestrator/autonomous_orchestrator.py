@@ -7,12 +7,18 @@ Date: December 2025
 
 import os
 import json
+import time
+import random
 import asyncio
+import hashlib
+import functools
 from datetime import datetime
-from typing import Dict, List, Optional
-from dataclasses import dataclass, asdict
-import subprocess
-import requests
+from email.utils import parsedate_to_datetime
+from typing import Dict, List, Optional, Tuple, Union
+from dataclasses import dataclass, asdict, field
+import aiohttp
+import pygit2
+from jinja2 import Template
 from pathlib import Path
 
 
@@ -28,11 +34,38 @@ class ProductConfig:
     target_mrr: float
     github_repo: str
     deployment_type: str = "kubernetes"
+    port: int = 5000
+    # Pin with an @sha256 digest for reproducible image layers
+    base_image: str = "python:3.11-slim"
+    pricing_tiers: Dict[str, float] = field(default_factory=dict)
+    features: List[str] = field(default_factory=list)
+
+
+class RateLimitError(Exception):
+    """Raised when GitHub keeps throttling a request after all retries"""
+    
+    def __init__(self, reset_at: Optional[float] = None):
+        self.reset_at = reset_at
+        if reset_at is None:
+            super().__init__("GitHub rate limit exceeded")
+        else:
+            super().__init__(f"GitHub rate limit exceeded, resets at {reset_at:.0f}")
+
+
+class _PushCallbacks(pygit2.RemoteCallbacks):
+    """Remote callbacks that turn server-side ref rejections into errors"""
+    
+    def push_update_reference(self, refname, message):
+        # libgit2 only reports rejected refs (protected branches, hooks) here
+        if message is not None:
+            raise pygit2.GitError(f"push of {refname} rejected: {message}")
 
 
 class GitHubManager:
     """Manages GitHub repository creation and code deployment"""
     
+    MAX_RETRIES = 5
+    
     def __init__(self, token: str):
         self.token = token
         self.headers = {
@@ -40,6 +73,85 @@ class GitHubManager:
             "Accept": "application/vnd.github.v3+json"
         }
         self.api_url = "https://api.github.com"
+        self._session: Optional[aiohttp.ClientSession] = None
+        # When the last response exhausted the quota, the next call waits until this
+        self._reset_at = 0.0
+    
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Lazily create the shared HTTP session"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit_per_host=5)
+            )
+        return self._session
+    
+    async def close(self):
+        """Close the shared HTTP session"""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+    
+    async def _request(self, method: str, url: str, **kwargs) -> aiohttp.ClientResponse:
+        """Issue a GitHub API request, honoring rate limits and retrying transient errors"""
+        # Quota exhausted by an earlier call: wait for the window to reset first
+        await asyncio.sleep(max(0, self._reset_at - time.time()))
+        
+        for attempt in range(self.MAX_RETRIES):
+            async with self._get_session().request(
+                method, url, headers=self.headers, **kwargs
+            ) as response:
+                # Buffer the body so it stays readable after the connection is released
+                await response.read()
+            
+            remaining = int(response.headers.get("X-RateLimit-Remaining", 1))
+            reset_header = response.headers.get("X-RateLimit-Reset")
+            retry_after = response.headers.get("Retry-After")
+            
+            # 403 is only transient when it comes from GitHub's rate limiters
+            throttled = response.status == 429 or (
+                response.status == 403 and (remaining == 0 or retry_after is not None)
+            )
+            retryable = throttled or response.status >= 500
+            
+            # Out of retries: give up without waiting for an attempt that won't happen
+            if retryable and attempt == self.MAX_RETRIES - 1:
+                break
+            
+            if not retryable:
+                # Hand back the result now; the next request pays for an empty quota
+                if remaining == 0 and reset_header is not None:
+                    self._reset_at = int(reset_header)
+                return response
+            
+            if remaining == 0 and reset_header is not None:
+                await asyncio.sleep(max(0, int(reset_header) - time.time()))
+            else:
+                await asyncio.sleep(self._retry_delay(retry_after, attempt))
+        
+        # A persistent 5xx is an outage, not throttling: let the caller report it
+        if not throttled:
+            return response
+        if reset_header is not None:
+            self._reset_at = int(reset_header)
+            raise RateLimitError(reset_at=self._reset_at)
+        raise RateLimitError()
+    
+    @staticmethod
+    def _retry_delay(retry_after: Optional[str], attempt: int) -> float:
+        """Seconds to wait before a retry, from Retry-After or exponential backoff"""
+        if retry_after is not None:
+            try:
+                return max(0.0, float(retry_after))
+            except ValueError:
+                pass
+            
+            # Retry-After may also be an HTTP date
+            try:
+                return max(0.0, parsedate_to_datetime(retry_after).timestamp() - time.time())
+            except (TypeError, ValueError):
+                pass
+        
+        return 2 ** attempt + random.random()
     
     async def create_repository(self, repo_name: str, description: str, is_public: bool = True) -> Dict:
         """Create GitHub repository"""
@@ -56,15 +168,15 @@ class GitHubManager:
         }
         
         try:
-            response = requests.post(
+            response = await self._request(
+                "POST",
                 f"{self.api_url}/user/repos",
-                headers=self.headers,
                 json=payload,
-                timeout=10
+                timeout=aiohttp.ClientTimeout(total=10)
             )
             
-            if response.status_code == 201:
-                repo_data = response.json()
+            if response.status == 201:
+                repo_data = await response.json()
                 print(f"✓ Repository created: {repo_data['html_url']}")
                 return {
                     "success": True,
@@ -73,37 +185,119 @@ class GitHubManager:
                     "ssh_url": repo_data["ssh_url"]
                 }
             else:
-                print(f"✗ Failed to create repository: {response.status_code}")
-                return {"success": False, "error": response.text}
+                print(f"✗ Failed to create repository: {response.status}")
+                return {"success": False, "error": await response.text()}
         except Exception as e:
             print(f"✗ Error creating repository: {str(e)}")
             return {"success": False, "error": str(e)}
     
-    async def push_code(self, repo_path: str, repo_url: str) -> bool:
-        """Push code to GitHub repository"""
-        print(f"\n[3/5] Pushing code to repository...")
+    async def create_repositories_bulk(self, specs: List[Tuple[str, str, bool]]) -> List[Dict]:
+        """Create several GitHub repositories with one aliased GraphQL mutation"""
+        if not specs:
+            return []
+        
+        print(f"\n[2/5] Creating {len(specs)} GitHub repositories in one request...")
+        
+        params, mutations, variables = [], [], {}
+        for i, (repo_name, description, is_public) in enumerate(specs):
+            params.append(f"$i{i}: CreateRepositoryInput!")
+            mutations.append(f"r{i}: createRepository(input: $i{i}) {{ repository {{ url sshUrl }} }}")
+            # CreateRepositoryInput has no projects flag; GitHub enables projects
+            # by default, matching the REST payload's has_projects=True
+            variables[f"i{i}"] = {
+                "name": repo_name,
+                "description": description,
+                "visibility": "PUBLIC" if is_public else "PRIVATE",
+                "hasIssuesEnabled": True,
+                "hasWikiEnabled": False
+            }
+        query = f"mutation({', '.join(params)}) {{ {' '.join(mutations)} }}"
         
         try:
-            os.chdir(repo_path)
+            response = await self._request(
+                "POST",
+                f"{self.api_url}/graphql",
+                json={"query": query, "variables": variables},
+                timeout=aiohttp.ClientTimeout(total=30)
+            )
             
-            # Initialize git if needed
-            if not Path(repo_path + "/.git").exists():
-                subprocess.run(["git", "init"], check=True, capture_output=True)
-                subprocess.run(["git", "config", "user.email", "zero-human@grid.ai"], check=True, capture_output=True)
-                subprocess.run(["git", "config", "user.name", "Zero-Human Grid"], check=True, capture_output=True)
+            if response.status != 200:
+                print(f"✗ GraphQL repository creation failed: {response.status}")
+                error = await response.text()
+                return [{"success": False, "error": error} for _ in specs]
             
-            # Add and commit
-            subprocess.run(["git", "add", "."], check=True, capture_output=True)
-            subprocess.run(["git", "commit", "-m", "feat: Initial product deployment"], check=True, capture_output=True)
+            data = (await response.json()).get("data") or {}
+        except Exception as e:
+            # Includes RateLimitError: retrying per repository would only add load
+            print(f"✗ Error creating repositories: {str(e)}")
+            return [{"success": False, "error": str(e)} for _ in specs]
+        
+        results = [None] * len(specs)
+        fallbacks = []
+        for i, (repo_name, description, is_public) in enumerate(specs):
+            repo_data = (data.get(f"r{i}") or {}).get("repository")
             
-            # Set remote and push
-            subprocess.run(["git", "remote", "add", "origin", repo_url], check=True, capture_output=True)
-            subprocess.run(["git", "branch", "-M", "main"], check=True, capture_output=True)
-            subprocess.run(["git", "push", "-u", "origin", "main"], check=True, capture_output=True)
+            if repo_data:
+                print(f"✓ Repository created: {repo_data['url']}")
+                results[i] = {
+                    "success": True,
+                    "url": repo_data["url"],
+                    "clone_url": f"{repo_data['url']}.git",
+                    "ssh_url": repo_data["sshUrl"]
+                }
+            else:
+                fallbacks.append(i)
+        
+        # Partial failure: retry only the null aliases through the REST endpoint
+        fallback_results = await asyncio.gather(*[
+            self.create_repository(*specs[i]) for i in fallbacks
+        ])
+        for i, result in zip(fallbacks, fallback_results):
+            results[i] = result
+        
+        return results
+    
+    def _push_repository(self, repo_path: str, repo_url: str):
+        """Commit and push repo_path in-process with libgit2 (blocking)"""
+        repo = pygit2.init_repository(repo_path, initial_head="main")
+        
+        # Add and commit
+        index = repo.index
+        index.add_all()
+        index.write()
+        tree = index.write_tree()
+        signature = pygit2.Signature("Zero-Human Grid", "zero-human@grid.ai")
+        # Cached product directories may already hold this exact tree
+        if repo.head_is_unborn or repo.head.peel(pygit2.Commit).tree.id != tree:
+            parents = [] if repo.head_is_unborn else [repo.head.target]
+            repo.create_commit(
+                "refs/heads/main", signature, signature,
+                "feat: Initial product deployment", tree, parents
+            )
+        
+        # Set remote and push
+        if "origin" in repo.remotes.names():
+            repo.remotes.set_url("origin", repo_url)
+        else:
+            repo.remotes.create("origin", repo_url)
+        remote = repo.remotes["origin"]
+        credentials = pygit2.UserPass("x-access-token", self.token)
+        remote.push(
+            ["refs/heads/main:refs/heads/main"],
+            callbacks=_PushCallbacks(credentials=credentials)
+        )
+    
+    async def push_code(self, repo_path: str, repo_url: str) -> bool:
+        """Push code to GitHub repository"""
+        print(f"\n[3/5] Pushing code to repository...")
+        
+        try:
+            # libgit2 avoids forking git per step; the thread keeps the loop free
+            await asyncio.to_thread(self._push_repository, repo_path, repo_url)
             
             print("✓ Code pushed successfully")
             return True
-        except subprocess.CalledProcessError as e:
+        except pygit2.GitError as e:
             print(f"✗ Git error: {str(e)}")
             return False
         except Exception as e:
@@ -114,7 +308,78 @@ class GitHubManager:
 class ProductFactory:
     """Generates product code from templates"""
     
-    TEMPLATES = {
+    # Per-user, so other local accounts can't plant builds that get pushed
+    CACHE_DIR = os.path.join(
+        os.getenv("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"), "neural-mesh"
+    )
+    
+    # Scaffold shared by every product, specialized with its ProductConfig
+    _BASE_TEMPLATES = {
+        "requirements.txt": """Flask==3.0.0
+gunicorn==21.2.0
+pytest==7.4.3
+pytest-cov==4.1.0
+requests==2.31.0
+""",
+        "Dockerfile": """# syntax=docker/dockerfile:1.7
+FROM {{ config.base_image }}
+
+WORKDIR /app
+
+COPY requirements.txt .
+RUN --mount=type=cache,target=/root/.cache/pip pip install -r requirements.txt
+
+COPY . .
+
+EXPOSE {{ config.port }}
+
+CMD ["gunicorn", "--bind", "0.0.0.0:{{ config.port }}", "app:app"]
+""",
+        "README.md": """# {{ config.name }}
+
+{{ config.description }} for enterprise deployment.
+
+## Features
+
+{% for feature in config.features %}
+- {{ feature }}
+{% endfor %}
+
+## Quick Start
+
+```bash
+pip install -r requirements.txt
+python app.py
+```
+
+## Testing
+
+```bash
+pytest --cov=. test_app.py
+```
+
+## Docker
+
+```bash
+docker build -t {{ config.template }} .
+docker run -p {{ config.port }}:{{ config.port }} {{ config.template }}
+```
+
+## Pricing
+
+{% for tier, price in config.pricing_tiers.items() %}
+- {{ tier }}: ${{ "%g"|format(price) }}/month
+{% endfor %}
+
+Target MRR: ${{ "{:,.0f}".format(config.target_mrr) }}
+Annual Run Rate: ${{ "{:,.0f}".format(config.target_mrr * 12) }}
+
+Built with Zero-Human Enterprise Grid
+"""
+    }
+    
+    # Product-specific service code, layered over the base scaffold
+    _RAW_TEMPLATES = {
         "mesh-messenger": {
             "app.py": """from flask import Flask, jsonify, request
 from datetime import datetime
@@ -125,7 +390,7 @@ app = Flask(__name__)
 def health():
     return jsonify({
         "status": "healthy",
-        "service": "mesh-messenger",
+        "service": "{{ config.template }}",
         "timestamp": datetime.utcnow().isoformat()
     }), 200
 
@@ -157,13 +422,7 @@ def not_found(e):
     return jsonify({"error": "Not found"}), 404
 
 if __name__ == '__main__':
-    app.run(debug=True, host='0.0.0.0', port=5000)
-""",
-            "requirements.txt": """Flask==3.0.0
-gunicorn==21.2.0
-pytest==7.4.3
-pytest-cov==4.1.0
-requests==2.31.0
+    app.run(debug=True, host='0.0.0.0', port={{ config.port }})
 """,
             "test_app.py": """import pytest
 from app import app
@@ -194,89 +453,98 @@ def test_get_nodes(client):
     response = client.get('/api/nodes')
     assert response.status_code == 200
     assert 'nodes' in response.json
-""",
-            "Dockerfile": """FROM python:3.11-slim
-
-WORKDIR /app
-
-COPY requirements.txt .
-RUN pip install --no-cache-dir -r requirements.txt
-
-COPY . .
-
-EXPOSE 5000
-
-CMD ["gunicorn", "--bind", "0.0.0.0:5000", "app:app"]
-""",
-            "README.md": """# Zero-Human Mesh Messenger
-
-AI-powered offline mesh communication network for enterprise deployment.
-
-## Features
-
-- Offline mesh networking capability
-- Zero-human deployment via CI/CD
-- Real-time message synchronization
-- Self-healing network topology
-- Enterprise-grade security
-
-## Quick Start
-
-```bash
-pip install -r requirements.txt
-python app.py
-```
-
-## Testing
-
-```bash
-pytest --cov=. test_app.py
-```
-
-## Docker
-
-```bash
-docker build -t mesh-messenger .
-docker run -p 5000:5000 mesh-messenger
-```
-
-## Pricing
-
-- Starter: $9/month
-- Professional: $49/month
-- Enterprise: $99/month
-
-Target MRR: $14,500
-Annual Run Rate: $174,000
-
-Built with Zero-Human Enterprise Grid
 """
         }
     }
     
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def _compiled(cls, template_name: str) -> Dict[str, Union[bytes, Template]]:
+        """Prepare a template set once: encode static files, compile the rest"""
+        sources = {**cls._BASE_TEMPLATES, **cls._RAW_TEMPLATES[template_name]}
+        return {
+            filename: Template(source, trim_blocks=True, lstrip_blocks=True,
+                               keep_trailing_newline=True)
+            if any(tag in source for tag in ("{{", "{%", "{#"))
+            else source.encode("utf-8")
+            for filename, source in sources.items()
+        }
+    
+    @classmethod
+    def cache_dir_for(cls, template_name: str, config: ProductConfig) -> str:
+        """Cache directory for a product, keyed by its config and template sources"""
+        sources = {**cls._BASE_TEMPLATES, **cls._RAW_TEMPLATES.get(template_name, {})}
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(json.dumps(asdict(config), sort_keys=True).encode())
+        for filename in sorted(sources):
+            digest.update(filename.encode())
+            digest.update(sources[filename].encode())
+        return f"{cls.CACHE_DIR}/{digest.hexdigest()}"
+    
     @staticmethod
-    def generate_product(template_name: str, output_dir: str) -> bool:
-        """Generate product files from template"""
+    def _is_cached(output_dir: str, filenames) -> bool:
+        """Whether output_dir holds a completed build with every expected file"""
+        # Marker lives beside the directory so it never ends up in the pushed repo
+        if not Path(f"{output_dir}.done").is_file() or not Path(output_dir).is_dir():
+            return False
+        return all((Path(output_dir) / filename).is_file() for filename in filenames)
+    
+    @staticmethod
+    def _write_file(filepath: Path, content: bytes):
+        """Write a generated file, creating parent directories (blocking)"""
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        filepath.write_bytes(content)
+    
+    @classmethod
+    async def generate_product_async(cls, template_name: str, output_dir: str,
+                                     config: Optional[ProductConfig] = None) -> bool:
+        """Generate product files from template, writing them concurrently"""
         print(f"\n[1/5] Generating product from template: {template_name}...")
         
-        if template_name not in ProductFactory.TEMPLATES:
+        if template_name not in cls._RAW_TEMPLATES:
             print(f"✗ Template '{template_name}' not found")
             return False
         
+        # Callers that predate parameterized templates pass no config
+        if config is None:
+            config = AutonomousOrchestrator.PRODUCT_CONFIGS.get(template_name)
+            if config is None:
+                print(f"✗ No product config for template '{template_name}'")
+                return False
+        
         try:
-            template = ProductFactory.TEMPLATES[template_name]
+            template = cls._compiled(template_name)
+            if cls._is_cached(output_dir, template):
+                print(f"  ✓ Reusing cached build in {output_dir}")
+                return True
+            
+            Path(cls.CACHE_DIR).mkdir(mode=0o700, parents=True, exist_ok=True)
             Path(output_dir).mkdir(parents=True, exist_ok=True)
             
-            for filename, content in template.items():
-                filepath = Path(output_dir) / filename
-                filepath.parent.mkdir(parents=True, exist_ok=True)
-                filepath.write_text(content)
+            await asyncio.gather(*[
+                asyncio.to_thread(
+                    cls._write_file,
+                    Path(output_dir) / filename,
+                    compiled if isinstance(compiled, bytes)
+                    else compiled.render(config=config).encode("utf-8")
+                )
+                for filename, compiled in template.items()
+            ])
+            
+            for filename in template:
                 print(f"  ✓ Generated {filename}")
             
+            Path(f"{output_dir}.done").touch()
             return True
         except Exception as e:
             print(f"✗ Error generating product: {str(e)}")
             return False
+    
+    @classmethod
+    def generate_product(cls, template_name: str, output_dir: str,
+                         config: Optional[ProductConfig] = None) -> bool:
+        """Generate product files from template (synchronous wrapper)"""
+        return asyncio.run(cls.generate_product_async(template_name, output_dir, config))
 
 
 class QuantumRevenueEngine:
@@ -286,6 +554,7 @@ class QuantumRevenueEngine:
         self.stripe_key = stripe_key
         self.paypal_id = paypal_id
         self.revenue_streams = []
+        self._total_mrr = 0.0
     
     async def register_product(self, config: ProductConfig) -> Dict:
         """Register product with revenue engine"""
@@ -302,6 +571,7 @@ class QuantumRevenueEngine:
         }
         
         self.revenue_streams.append(product_revenue)
+        self._total_mrr += config.target_mrr
         print(f"✓ Product registered: {config.name}")
         print(f"  Target MRR: ${config.target_mrr:,.2f}")
         print(f"  Annual Run Rate: ${config.target_mrr * 12:,.2f}")
@@ -310,13 +580,10 @@ class QuantumRevenueEngine:
     
     def get_portfolio_summary(self) -> Dict:
         """Get total portfolio revenue"""
-        total_mrr = sum(stream["target_mrr"] for stream in self.revenue_streams)
-        total_arr = total_mrr * 12
-        
         return {
             "products": len(self.revenue_streams),
-            "total_mrr": total_mrr,
-            "annual_run_rate": total_arr,
+            "total_mrr": self._total_mrr,
+            "annual_run_rate": self._total_mrr * 12,
             "products_detail": self.revenue_streams
         }
 
@@ -333,7 +600,15 @@ class AutonomousOrchestrator:
             pricing_min=9,
             pricing_max=99,
             target_mrr=14500,
-            github_repo="mesh-messenger"
+            github_repo="mesh-messenger",
+            pricing_tiers={"Starter": 9, "Professional": 49, "Enterprise": 99},
+            features=[
+                "Offline mesh networking capability",
+                "Zero-human deployment via CI/CD",
+                "Real-time message synchronization",
+                "Self-healing network topology",
+                "Enterprise-grade security"
+            ]
         ),
     }
     
@@ -343,30 +618,84 @@ class AutonomousOrchestrator:
         self.github_manager = GitHubManager(github_token)
         self.revenue_engine = QuantumRevenueEngine(stripe_key, paypal_id)
         self.products = {}
+        # Cap concurrent product lines to keep GitHub fan-out polite
+        self._sem = asyncio.Semaphore(8)
     
     async def create_product_line(self, product_type: str) -> Optional[ProductConfig]:
         """Create a complete product line"""
         
-        if product_type not in self.PRODUCT_CONFIGS:
+        config = self.PRODUCT_CONFIGS.get(product_type)
+        if config is None:
             print(f"✗ Product type '{product_type}' not recognized")
             return None
         
-        config = self.PRODUCT_CONFIGS[product_type]
+        async with self._sem:
+            print("\n" + "="*60)
+            print(f"CREATING NEW PRODUCT LINE: {product_type.upper()}")
+            print("="*60)
+            
+            # Step 1: Generate from template
+            temp_dir = ProductFactory.cache_dir_for(product_type, config)
+            if not await ProductFactory.generate_product_async(product_type, temp_dir, config):
+                return None
+            
+            # Step 2: Create GitHub repo
+            repo_result = await self.github_manager.create_repository(
+                config.github_repo,
+                config.description
+            )
+            
+            return await self._deploy_product_line(product_type, config, temp_dir, repo_result)
+    
+    async def create_product_lines(self, product_types: List[str]) -> List[Optional[ProductConfig]]:
+        """Create several product lines, batching their repository creation"""
+        
+        configs = {}
+        for product_type in product_types:
+            config = self.PRODUCT_CONFIGS.get(product_type)
+            if config is None:
+                print(f"✗ Product type '{product_type}' not recognized")
+            else:
+                configs[product_type] = config
         
         print("\n" + "="*60)
-        print(f"CREATING NEW PRODUCT LINE: {product_type.upper()}")
+        print(f"CREATING {len(configs)} NEW PRODUCT LINES: {', '.join(configs).upper()}")
         print("="*60)
         
-        # Step 1: Generate from template
-        temp_dir = f"/tmp/{product_type}"
-        if not ProductFactory.generate_product(product_type, temp_dir):
-            return None
+        # Step 1: Generate every product from its template
+        temp_dirs = {
+            product_type: ProductFactory.cache_dir_for(product_type, config)
+            for product_type, config in configs.items()
+        }
+        generated = await asyncio.gather(*[
+            ProductFactory.generate_product_async(product_type, temp_dirs[product_type], config)
+            for product_type, config in configs.items()
+        ])
+        ready = [product_type for product_type, ok in zip(configs, generated) if ok]
         
-        # Step 2: Create GitHub repo
-        repo_result = await self.github_manager.create_repository(
-            config.github_repo,
-            config.description
-        )
+        # Step 2: Create all GitHub repos in a single round-trip
+        repo_results = await self.github_manager.create_repositories_bulk([
+            (configs[product_type].github_repo, configs[product_type].description, True)
+            for product_type in ready
+        ])
+        
+        async def deploy(product_type: str, repo_result: Dict) -> Optional[ProductConfig]:
+            async with self._sem:
+                return await self._deploy_product_line(
+                    product_type, configs[product_type], temp_dirs[product_type], repo_result
+                )
+        
+        deployed = await asyncio.gather(*[
+            deploy(product_type, repo_result)
+            for product_type, repo_result in zip(ready, repo_results)
+        ])
+        created = dict(zip(ready, deployed))
+        
+        return [created.get(product_type) for product_type in product_types]
+    
+    async def _deploy_product_line(self, product_type: str, config: ProductConfig,
+                                   temp_dir: str, repo_result: Dict) -> Optional[ProductConfig]:
+        """Push, register and record a generated product once its repo exists"""
         
         if not repo_result.get("success"):
             print("✗ Failed to create GitHub repository")
@@ -394,6 +723,10 @@ class AutonomousOrchestrator:
         
         return config
     
+    async def shutdown(self):
+        """Release network resources"""
+        await self.github_manager.close()
+    
     def get_portfolio_summary(self) -> Dict:
         """Get total portfolio summary"""
         summary = self.revenue_engine.get_portfolio_summary()
@@ -421,10 +754,13 @@ async def main():
         paypal_id=paypal_id
     )
     
-    # Create mesh-messenger product line
-    product = await orchestrator.create_product_line("mesh-messenger")
+    # Create every configured product line, batching repository creation
+    try:
+        products = await orchestrator.create_product_lines(list(orchestrator.PRODUCT_CONFIGS))
+    finally:
+        await orchestrator.shutdown()
     
-    if product:
+    if any(products):
         # Get portfolio summary
         summary = orchestrator.get_portfolio_summary()
         
@@ -438,13 +774,15 @@ async def main():
         
         # Show next steps
         print("\n📋 NEXT STEPS:")
-        print(f"1. Repository: {orchestrator.products['mesh-messenger']['repo_url']}")
+        print("1. Repositories:")
+        for product_type, product in orchestrator.products.items():
+            print(f"   - {product_type}: {product['repo_url']}")
         print("2. Set up GitHub Actions for CI/CD")
         print("3. Configure payment webhooks (Stripe/PayPal)")
         print("4. Deploy to Kubernetes")
         print("5. Monitor revenue streams\n")
     else:
-        print("✗ Failed to create product line")
+        print("✗ Failed to create product lines")
 
 
 if __name__ == "__main__":
@@ -5,32 +5,42 @@ Author: Garrett Carroll
 Date: December 2025
 """
 
-import json
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional
-from dataclasses import dataclass, asdict, field
-from enum import Enum
+import os
+import mmap
+import struct
+import tempfile
+from time import time_ns
+import numpy as np
+import orjson
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+from dataclasses import dataclass, field, fields, is_dataclass
+from enum import IntEnum
 
 
-class RevenueStream(Enum):
+class RevenueStream(IntEnum):
     """Revenue stream types"""
-    SAAS_SUBSCRIPTION = "saas_subscription"
-    USAGE_BASED = "usage_based"
-    ENTERPRISE_LICENSE = "enterprise_license"
-    MARKETPLACE = "marketplace"
+    SAAS_SUBSCRIPTION = 0
+    USAGE_BASED = 1
+    ENTERPRISE_LICENSE = 2
+    MARKETPLACE = 3
 
 
-@dataclass
+# Report labels indexed by stream id
+_STREAM_NAMES = tuple(stream.name.lower() for stream in RevenueStream)
+
+
+@dataclass(slots=True, frozen=True)
 class RevenueMetric:
     """Individual revenue metric"""
-    stream_type: RevenueStream
+    stream_type: int
     amount: float
     currency: str = "USD"
-    timestamp: str = field(default_factory=lambda: datetime.utcnow().isoformat())
+    timestamp: int = field(default_factory=time_ns)
     source_product: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class ProductRevenue:
     """Product revenue tracking"""
     product_id: str
@@ -41,16 +51,122 @@ class ProductRevenue:
     active_customers: int = 0
     churn_rate: float = 0.0
     lifetime_value: float = 0.0
-    revenue_history: List[RevenueMetric] = field(default_factory=list)
+    total_recorded_revenue: float = 0.0
+    # Internal link into the history log, left out of exported reports
+    history_id: int = field(default=0, metadata={"export": False})
+
+
+def _default(obj):
+    """orjson fallback that walks dataclasses in place instead of asdict() copies"""
+    if not is_dataclass(obj):
+        raise TypeError
+    
+    # Slotted dataclasses have no __dict__, so expose fields shallowly
+    return {
+        f.name: getattr(obj, f.name)
+        for f in fields(obj) if f.metadata.get("export", True)
+    }
+
+
+class RevenueHistoryLog:
+    """Append-only, memory-mapped file of fixed-width revenue records
+    
+    Each record packs time_ns, amount, product history id and stream id.
+    The file starts with the record count, and a persistent log keeps its
+    product id table in a "<path>.products" sidecar so it can be reopened.
+    """
+    
+    HEADER = struct.Struct("<Q")
+    RECORD = struct.Struct("<qdIB")
+    DTYPE = np.dtype([("t", "<i8"), ("amt", "<f8"), ("pid", "<u4"), ("s", "u1")])
+    
+    def __init__(self, path: Optional[str] = None, capacity: int = 4096):
+        if path is None:
+            self._file = tempfile.TemporaryFile()
+            self._ids_path = None
+        else:
+            self._file = open(path, "r+b" if os.path.exists(path) else "w+b")
+            self._ids_path = f"{path}.products"
+        
+        # product_ids[history_id] -> product id, restored for reopened logs
+        self.product_ids: List[str] = []
+        if self._ids_path is not None and os.path.exists(self._ids_path):
+            with open(self._ids_path, "rb") as f:
+                self.product_ids = orjson.loads(f.read())
+        self._history_ids = {pid: i for i, pid in enumerate(self.product_ids)}
+        
+        min_size = self.HEADER.size + capacity * self.RECORD.size
+        if os.fstat(self._file.fileno()).st_size < min_size:
+            self._file.truncate(min_size)
+        
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_WRITE)
+        self._count = self.HEADER.unpack_from(self._mmap, 0)[0]
+    
+    def __len__(self) -> int:
+        return self._count
+    
+    def history_id(self, product_id: str) -> Tuple[int, bool]:
+        """Stable history id for a product and whether it was newly assigned"""
+        history_id = self._history_ids.get(product_id)
+        if history_id is not None:
+            return history_id, False
+        
+        history_id = len(self.product_ids)
+        self.product_ids.append(product_id)
+        self._history_ids[product_id] = history_id
+        
+        if self._ids_path is not None:
+            # Write then rename so a crash never leaves a truncated table
+            tmp_path = f"{self._ids_path}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(orjson.dumps(self.product_ids))
+            os.replace(tmp_path, self._ids_path)
+        
+        return history_id, True
+    
+    def append(self, timestamp: int, amount: float, history_id: int, stream_id: int):
+        """Append one record, doubling the file when it is full"""
+        offset = self.HEADER.size + self._count * self.RECORD.size
+        if offset + self.RECORD.size > len(self._mmap):
+            self._grow()
+        
+        self.RECORD.pack_into(self._mmap, offset, timestamp, amount, history_id, stream_id)
+        self._count += 1
+        self.HEADER.pack_into(self._mmap, 0, self._count)
+    
+    def _grow(self):
+        size = self.HEADER.size + 2 * (len(self._mmap) - self.HEADER.size)
+        self._mmap.close()
+        self._file.truncate(size)
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_WRITE)
+    
+    def records(self) -> np.ndarray:
+        """Zero-copy structured view of every record written so far"""
+        if self._count == 0:
+            return np.empty(0, dtype=self.DTYPE)
+        
+        # A separate read-only mapping, so appends can still grow the log
+        return np.memmap(self._file, dtype=self.DTYPE, mode="r",
+                         offset=self.HEADER.size, shape=(self._count,))
+    
+    def close(self):
+        self._mmap.close()
+        self._file.close()
 
 
 class QuantumRevenueEngine:
     """Advanced revenue tracking and optimization engine"""
     
-    def __init__(self):
+    def __init__(self, history_path: Optional[str] = None):
         self.products: Dict[str, ProductRevenue] = {}
-        self.total_revenue_history: List[RevenueMetric] = []
-        self.created_at = datetime.utcnow()
+        # Transactions stream to disk; only aggregates are kept in memory
+        self.history = RevenueHistoryLog(history_path)
+        self.created_at = datetime.now(timezone.utc)
+        
+        # Running portfolio aggregates so summaries never re-scan products
+        self._total_mrr = 0.0
+        self._total_customers = 0
+        self._sum_churn = 0.0
     
     def register_product(self, product_id: str, product_name: str, 
                         pricing_min: float, pricing_max: float,
@@ -65,5 +181,248 @@ class QuantumRevenueEngine:
             monthly_recurring_revenue=target_mrr
         )
         
+        replaced = self.products.get(product_id)
+        if replaced is not None:
+            self._total_mrr -= replaced.monthly_recurring_revenue
+            self._total_customers -= replaced.active_customers
+            self._sum_churn -= replaced.churn_rate
+        
+        product.history_id, is_new = self.history.history_id(product_id)
+        
+        # Carry over transactions already in the log (re-registration, reopened log)
+        if not is_new:
+            records = self.history.records()
+            product.total_recorded_revenue = float(
+                records["amt"][records["pid"] == product.history_id].sum()
+            )
+        
         self.products[product_id] = product
-        print(f\"✓ Registered: {product_name}\")\n        print(f\"  Target MRR: ${target_mrr:,.2f}\")\n        print(f\"  Annual Run Rate: ${target_mrr * 12:,.2f}\")\n        \n        return product\n    \n    def record_transaction(self, product_id: str, amount: float,\n                          stream_type: RevenueStream = RevenueStream.SAAS_SUBSCRIPTION) -> bool:\n        \"\"\"Record a revenue transaction\"\"\"\n        \n        if product_id not in self.products:\n            return False\n        \n        metric = RevenueMetric(\n            stream_type=stream_type,\n            amount=amount,\n            source_product=product_id\n        )\n        \n        self.products[product_id].revenue_history.append(metric)\n        self.total_revenue_history.append(metric)\n        \n        return True\n    \n    def update_customer_count(self, product_id: str, customer_count: int) -> bool:\n        \"\"\"Update active customer count for a product\"\"\"\n        \n        if product_id not in self.products:\n            return False\n        \n        self.products[product_id].active_customers = customer_count\n        return True\n    \n    def calculate_churn_rate(self, product_id: str, previous_customers: int,\n                            current_customers: int, period_days: int = 30) -> float:\n        \"\"\"Calculate churn rate for a product\"\"\"\n        \n        if previous_customers == 0:\n            return 0.0\n        \n        churned = max(0, previous_customers - current_customers)\n        churn_rate = (churned / previous_customers) * 100\n        \n        if product_id in self.products:\n            self.products[product_id].churn_rate = churn_rate\n        \n        return churn_rate\n    \n    def calculate_ltv(self, product_id: str, avg_monthly_revenue: float,\n                     avg_customer_lifespan_months: int = 24) -> float:\n        \"\"\"Calculate lifetime value for a product\"\"\"\n        \n        ltv = avg_monthly_revenue * avg_customer_lifespan_months\n        \n        if product_id in self.products:\n            self.products[product_id].lifetime_value = ltv\n        \n        return ltv\n    \n    def get_product_summary(self, product_id: str) -> Optional[Dict]:\n        \"\"\"Get revenue summary for a specific product\"\"\"\n        \n        if product_id not in self.products:\n            return None\n        \n        product = self.products[product_id]\n        total_transactions = sum(m.amount for m in product.revenue_history)\n        \n        return {\n            \"product_id\": product.product_id,\n            \"product_name\": product.product_name,\n            \"target_mrr\": product.monthly_recurring_revenue,\n            \"annual_run_rate\": product.monthly_recurring_revenue * 12,\n            \"active_customers\": product.active_customers,\n            \"churn_rate\": f\"{product.churn_rate:.2f}%\",\n            \"lifetime_value\": f\"${product.lifetime_value:,.2f}\",\n            \"total_recorded_revenue\": f\"${total_transactions:,.2f}\",\n            \"pricing_range\": f\"${product.pricing_tier_min} - ${product.pricing_tier_max}/month\"\n        }\n    \n    def get_portfolio_summary(self) -> Dict:\n        \"\"\"Get summary of entire revenue portfolio\"\"\"\n        \n        total_mrr = sum(p.monthly_recurring_revenue for p in self.products.values())\n        total_arr = total_mrr * 12\n        total_customers = sum(p.active_customers for p in self.products.values())\n        avg_churn = sum(p.churn_rate for p in self.products.values()) / len(self.products) if self.products else 0\n        \n        return {\n            \"total_products\": len(self.products),\n            \"total_mrr\": f\"${total_mrr:,.2f}\",\n            \"total_arr\": f\"${total_arr:,.2f}\",\n            \"total_active_customers\": total_customers,\n            \"average_churn_rate\": f\"{avg_churn:.2f}%\",\n            \"portfolio\": [self.get_product_summary(pid) for pid in self.products.keys()]\n        }\n    \n    def project_revenue(self, months: int = 12) -> Dict:\n        \"\"\"Project revenue for next N months\"\"\"\n        \n        projections = []\n        current_date = datetime.utcnow()\n        \n        for month in range(1, months + 1):\n            projection_date = current_date + timedelta(days=30 * month)\n            \n            # Calculate projection considering churn\n            total_projected = 0\n            for product in self.products.values():\n                # Simple projection: MRR adjusted for churn\n                churn_factor = 1 - (product.churn_rate / 100)\n                projected_mrr = product.monthly_recurring_revenue * (churn_factor ** month)\n                total_projected += projected_mrr\n            \n            projections.append({\n                \"month\": month,\n                \"date\": projection_date.isoformat(),\n                \"projected_mrr\": f\"${total_projected:,.2f}\",\n                \"projected_arr\": f\"${total_projected * 12:,.2f}\"\n            })\n        \n        return {\n            \"projection_period_months\": months,\n            \"projections\": projections\n        }\n    \n    def export_report(self, filepath: str) -> bool:\n        \"\"\"Export revenue report to JSON file\"\"\"\n        \n        try:\n            report = {\n                \"generated_at\": datetime.utcnow().isoformat(),\n                \"portfolio_summary\": self.get_portfolio_summary(),\n                \"revenue_projections\": self.project_revenue(12),\n                \"products\": {\n                    pid: asdict(product) for pid, product in self.products.items()\n                }\n            }\n            \n            # Convert lists to JSON-serializable format\n            report_json = json.dumps(report, indent=2, default=str)\n            \n            with open(filepath, 'w') as f:\n                f.write(report_json)\n            \n            return True\n        except Exception as e:\n            print(f\"✗ Error exporting report: {str(e)}\")\n            return False\n\n\nif __name__ == \"__main__\":\n    # Example usage\n    engine = QuantumRevenueEngine()\n    \n    # Register products\n    engine.register_product(\n        \"mesh-messenger\",\n        \"Zero-Human Mesh Messenger\",\n        9.0, 99.0, 14500.0\n    )\n    \n    engine.register_product(\n        \"governance-platform\",\n        \"Zero-Human AI Governance Platform\",\n        299.0, 1999.0, 50000.0\n    )\n    \n    # Update metrics\n    engine.update_customer_count(\"mesh-messenger\", 2000)\n    engine.update_customer_count(\"governance-platform\", 50)\n    \n    # Calculate churn\n    engine.calculate_churn_rate(\"mesh-messenger\", 2100, 2000)\n    engine.calculate_churn_rate(\"governance-platform\", 52, 50)\n    \n    # Calculate LTV\n    engine.calculate_ltv(\"mesh-messenger\", 72.50, 24)  # $7.25/customer/month\n    engine.calculate_ltv(\"governance-platform\", 1000, 24)\n    \n    # Print portfolio summary\n    print(\"\\n\" + \"=\"*60)\n    print(\"PORTFOLIO REVENUE SUMMARY\")\n    print(\"=\"*60)\n    \n    summary = engine.get_portfolio_summary()\n    print(f\"Total Products: {summary['total_products']}\")\n    print(f\"Total MRR: {summary['total_mrr']}\")\n    print(f\"Total ARR: {summary['total_arr']}\")\n    print(f\"Total Active Customers: {summary['total_active_customers']}\")\n    print(f\"Average Churn Rate: {summary['average_churn_rate']}\")\n    \n    # Export report\n    engine.export_report(\"revenue_report.json\")\n    print(f\"\\n✓ Report exported to revenue_report.json\")\n
\ No newline at end of file
+        self._total_mrr += target_mrr
+        print(f"✓ Registered: {product_name}")
+        print(f"  Target MRR: ${target_mrr:,.2f}")
+        print(f"  Annual Run Rate: ${target_mrr * 12:,.2f}")
+        
+        return product
+    
+    def record_transaction(self, product_id: str, amount: float,
+                          stream_type: RevenueStream = RevenueStream.SAAS_SUBSCRIPTION) -> bool:
+        """Record a revenue transaction"""
+        
+        product = self.products.get(product_id)
+        if product is None:
+            return False
+        
+        self.history.append(time_ns(), amount, product.history_id, int(stream_type))
+        product.total_recorded_revenue += amount
+        
+        return True
+    
+    def get_revenue_history(self, product_id: str) -> List[RevenueMetric]:
+        """Load the recorded transactions for a product from the history log"""
+        
+        product = self.products.get(product_id)
+        if product is None:
+            return []
+        
+        records = self.history.records()
+        records = records[records["pid"] == product.history_id]
+        
+        return [
+            RevenueMetric(
+                stream_type=int(stream_id),
+                amount=float(amount),
+                timestamp=int(timestamp),
+                source_product=product_id
+            )
+            for timestamp, amount, stream_id in zip(
+                records["t"].tolist(), records["amt"].tolist(), records["s"].tolist()
+            )
+        ]
+    
+    def update_customer_count(self, product_id: str, customer_count: int) -> bool:
+        """Update active customer count for a product"""
+        
+        product = self.products.get(product_id)
+        if product is None:
+            return False
+        
+        self._total_customers += customer_count - product.active_customers
+        product.active_customers = customer_count
+        return True
+    
+    def calculate_churn_rate(self, product_id: str, previous_customers: int,
+                            current_customers: int, period_days: int = 30) -> float:
+        """Calculate churn rate for a product"""
+        
+        if previous_customers == 0:
+            return 0.0
+        
+        churned = max(0, previous_customers - current_customers)
+        churn_rate = (churned / previous_customers) * 100
+        
+        product = self.products.get(product_id)
+        if product is not None:
+            self._sum_churn += churn_rate - product.churn_rate
+            product.churn_rate = churn_rate
+        
+        return churn_rate
+    
+    def calculate_ltv(self, product_id: str, avg_monthly_revenue: float,
+                     avg_customer_lifespan_months: int = 24) -> float:
+        """Calculate lifetime value for a product"""
+        
+        ltv = avg_monthly_revenue * avg_customer_lifespan_months
+        
+        product = self.products.get(product_id)
+        if product is not None:
+            product.lifetime_value = ltv
+        
+        return ltv
+    
+    def get_product_summary(self, product_id: str) -> Optional[Dict]:
+        """Get revenue summary for a specific product"""
+        
+        product = self.products.get(product_id)
+        if product is None:
+            return None
+        
+        return {
+            "product_id": product.product_id,
+            "product_name": product.product_name,
+            "target_mrr": product.monthly_recurring_revenue,
+            "annual_run_rate": product.monthly_recurring_revenue * 12,
+            "active_customers": product.active_customers,
+            "churn_rate": f"{product.churn_rate:.2f}%",
+            "lifetime_value": f"${product.lifetime_value:,.2f}",
+            "total_recorded_revenue": f"${product.total_recorded_revenue:,.2f}",
+            "pricing_range": f"${product.pricing_tier_min} - ${product.pricing_tier_max}/month"
+        }
+    
+    def get_portfolio_summary(self) -> Dict:
+        """Get summary of entire revenue portfolio"""
+        
+        avg_churn = self._sum_churn / len(self.products) if self.products else 0
+        
+        return {
+            "total_products": len(self.products),
+            "total_mrr": f"${self._total_mrr:,.2f}",
+            "total_arr": f"${self._total_mrr * 12:,.2f}",
+            "total_active_customers": self._total_customers,
+            "average_churn_rate": f"{avg_churn:.2f}%",
+            "portfolio": [self.get_product_summary(pid) for pid in self.products.keys()]
+        }
+    
+    def project_revenue(self, months: int = 12) -> Dict:
+        """Project revenue for next N months"""
+        
+        current_date = datetime.now(timezone.utc)
+        
+        # Simple projection: MRR adjusted for churn, one row per month
+        mrr = np.fromiter(
+            (p.monthly_recurring_revenue for p in self.products.values()),
+            dtype=np.float64, count=len(self.products)
+        )
+        churn_factor = np.fromiter(
+            (1 - p.churn_rate / 100 for p in self.products.values()),
+            dtype=np.float64, count=len(self.products)
+        )
+        month_range = np.arange(1, months + 1)
+        projected = (mrr[None, :] * churn_factor[None, :] ** month_range[:, None]).sum(axis=1)
+        
+        projections = [
+            {
+                "month": month,
+                "date": (current_date + timedelta(days=30 * month)).isoformat(),
+                "projected_mrr": f"${total_projected:,.2f}",
+                "projected_arr": f"${total_projected * 12:,.2f}"
+            }
+            for month, total_projected in zip(range(1, months + 1), projected.tolist())
+        ]
+        
+        return {
+            "projection_period_months": months,
+            "projections": projections
+        }
+    
+    def export_report(self, filepath: str) -> bool:
+        """Export revenue report to JSON file"""
+        
+        try:
+            # Aggregate the on-disk history in one vectorized pass
+            records = self.history.records()
+            stream_totals = np.bincount(
+                records["s"], weights=records["amt"], minlength=len(_STREAM_NAMES)
+            )
+            
+            report = {
+                "generated_at": datetime.now(timezone.utc).isoformat(),
+                "portfolio_summary": self.get_portfolio_summary(),
+                "revenue_projections": self.project_revenue(12),
+                "revenue_by_stream": dict(zip(_STREAM_NAMES, stream_totals.tolist())),
+                "recorded_transactions": len(self.history),
+                "products": self.products
+            }
+            
+            with open(filepath, 'wb') as f:
+                f.write(orjson.dumps(
+                    report,
+                    default=_default,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_SERIALIZE_NUMPY
+                ))
+            
+            return True
+        except Exception as e:
+            print(f"✗ Error exporting report: {str(e)}")
+            return False
+    
+    def close(self):
+        """Release the history log"""
+        self.history.close()
+
+
+if __name__ == "__main__":
+    # Example usage
+    engine = QuantumRevenueEngine()
+    
+    # Register products
+    engine.register_product(
+        "mesh-messenger",
+        "Zero-Human Mesh Messenger",
+        9.0, 99.0, 14500.0
+    )
+    
+    engine.register_product(
+        "governance-platform",
+        "Zero-Human AI Governance Platform",
+        299.0, 1999.0, 50000.0
+    )
+    
+    # Update metrics
+    engine.update_customer_count("mesh-messenger", 2000)
+    engine.update_customer_count("governance-platform", 50)
+    
+    # Calculate churn
+    engine.calculate_churn_rate("mesh-messenger", 2100, 2000)
+    engine.calculate_churn_rate("governance-platform", 52, 50)
+    
+    # Calculate LTV
+    engine.calculate_ltv("mesh-messenger", 72.50, 24)  # $7.25/customer/month
+    engine.calculate_ltv("governance-platform", 1000, 24)
+    
+    # Print portfolio summary
+    print("\n" + "="*60)
+    print("PORTFOLIO REVENUE SUMMARY")
+    print("="*60)
+    
+    summary = engine.get_portfolio_summary()
+    print(f"Total Products: {summary['total_products']}")
+    print(f"Total MRR: {summary['total_mrr']}")
+    print(f"Total ARR: {summary['total_arr']}")
+    print(f"Total Active Customers: {summary['total_active_customers']}")
+    print(f"Average Churn Rate: {summary['average_churn_rate']}")
+    
+    # Export report
+    engine.export_report("revenue_report.json")
+    print(f"\n✓ Report exported to revenue_report.json")
+    
+    engine.close()